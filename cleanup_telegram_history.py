@@ -2,7 +2,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from datetime import datetime, timedelta
 import logging
 from sqlalchemy.orm import Session
-from db.engine import engine
+from db.engine import get_engine
 from db.models.base import TelegramChatMessage
 
 logger = logging.getLogger(__name__)
@@ -14,7 +14,7 @@ scheduler = AsyncIOScheduler()
 def cleanup_old_conversations():
     """Delete conversations older than 7 days"""
     try:
-        with Session(engine) as session:
+        with Session(get_engine()) as session:
             cutoff_date = datetime.now() - timedelta(days=7)
 
             deleted_count = session.query(TelegramChatMessage) \
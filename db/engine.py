@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from sqlalchemy import create_engine
 import dotenv
 
@@ -6,6 +7,10 @@ dotenv.load_dotenv()
 TURSO_DATABASE_URL = os.getenv("TURSO_DATABASE_URL")
 TURSO_AUTH_TOKEN = os.getenv("TURSO_AUTH_TOKEN")
 
-engine = create_engine(f"sqlite+{TURSO_DATABASE_URL}?secure=true", connect_args={
-    "auth_token": os.getenv("TURSO_AUTH_TOKEN"),
-})
+
+@lru_cache(maxsize=None)
+def get_engine():
+    """Build the Turso engine on first use and reuse it afterwards"""
+    return create_engine(f"sqlite+{TURSO_DATABASE_URL}?secure=true", connect_args={
+        "auth_token": TURSO_AUTH_TOKEN,
+    })
@@ -1,33 +1,36 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Annotated
-from fastapi import FastAPI, UploadFile, Depends, HTTPException,status, Form, Request, File
+from fastapi import APIRouter, FastAPI, UploadFile, Depends, HTTPException,status, Form, Request, File
 from db.models.base import Base
-import requests
 import os
 import dotenv
 import jwt
 from jwt.exceptions import InvalidTokenError
-from langchain.chat_models import init_chat_model
-from langchain_core.messages import HumanMessage, SystemMessage
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from utils.util import scape_format_embed, retrieve, scrape_links, define_message_intent, process_text_to_chrome
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from db.models.base import ChatMessage,ChatSession,TelegramChatMessage
-from db.engine import engine
-from telegram import Bot
+from db.engine import get_engine
 from json.decoder import JSONDecodeError
 from pydantic_models.models import UserQuery
-from cleanup_telegram_history import init_scheduler, start_scheduler, stop_scheduler
 from contextlib import asynccontextmanager
 
+# langchain, python-telegram-bot and the scheduler are imported where they are
+# used so that importing this module (and serving "/") stays fast on cold start.
+# Run `python scripts/import_time.py` to check the startup cost.
+
 dotenv.load_dotenv()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from cleanup_telegram_history import init_scheduler, start_scheduler, stop_scheduler
+
     # Startup
+    get_engine()
     init_scheduler()
     start_scheduler()
 
@@ -35,28 +38,23 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     stop_scheduler()
-app = FastAPI(lifespan=lifespan)
 
 
+router = APIRouter()
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-bot = Bot(token=BOT_TOKEN)
-
-origins = [
-    "http://localhost:3000",
-]
-variable_origin = os.getenv("ORIGIN")
-if variable_origin:
-    origins.append(str(variable_origin))
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+
+
+@lru_cache(maxsize=None)
+def get_bot():
+    """Build the Telegram bot on the first webhook call and reuse it afterwards"""
+    from telegram import Bot
+
+    return Bot(token=BOT_TOKEN)
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
@@ -106,14 +104,14 @@ def create_message_history(user_message, user_id, assistant_message, session):
     session.commit()
     session.close()
 
-@app.get("/")
+@router.get("/")
 async def root():
     return {"message": "hello world"}
 
 
-@app.get("/db_init")
+@router.get("/db_init")
 async def db_init(token: Annotated[str, Depends(get_admin_user)]):
-    Base.metadata.create_all(engine)
+    Base.metadata.create_all(get_engine())
     return {"status":"success init db"}
 
 def prompts():
@@ -124,6 +122,8 @@ def prompts():
     return intent_prompt, system_prompt
 
 def compile_ai_request(intent, user_message, chat_history='no history', ):
+    from langchain_core.messages import HumanMessage, SystemMessage
+
     intent_prompt, system_prompt = prompts()
     if "НЕ_ИСПОЛЬЗОВАТЬ_RAG" in intent:
         print('НЕ_ИСПОЛЬЗОВАТЬ_RAG')
@@ -140,9 +140,11 @@ def compile_ai_request(intent, user_message, chat_history='no history', ):
         ]
     return message
 
-@app.post("/chat")
+@router.post("/chat")
 async def chat(query: UserQuery):
-    session = Session(engine)
+    from langchain.chat_models import init_chat_model
+
+    session = Session(get_engine())
     stmt = select(ChatSession).where(ChatSession.id == query.session_id)
     chat_session = session.execute(stmt).scalar_one_or_none()
     if chat_session:
@@ -173,8 +175,10 @@ async def chat(query: UserQuery):
     print(response.response_metadata)
     return response.text()
 
-@app.post('/webhook/telegram-chat')
+@router.post('/webhook/telegram-chat')
 async def telegram_webhook(request: Request):
+    from langchain.chat_models import init_chat_model
+
     try:
         update_data = await request.json()
         print(update_data)
@@ -188,7 +192,7 @@ async def telegram_webhook(request: Request):
                 return bot_command
         except KeyError:
             pass
-        with Session(engine) as session:
+        with Session(get_engine()) as session:
             try:
                 chat_id = update_data["message"]["chat"]["id"]
                 user_message = update_data["message"]["text"]
@@ -212,11 +216,13 @@ async def telegram_webhook(request: Request):
                 create_message_history(user_message, chat_id, response.text(), session)
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f'error writing to database {str(e)}')
-            await bot.send_message(chat_id=chat_id, text=response.text())
+            await get_bot().send_message(chat_id=chat_id, text=response.text())
             return {"status": "ok"}
     raise HTTPException(status_code=404, detail="Message not found in request")
 
 def send_message(chat_id: int, text: str):
+    import requests
+
     url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
     payload = {
         "chat_id": chat_id,
@@ -225,7 +231,7 @@ def send_message(chat_id: int, text: str):
     response = requests.post(url, json=payload)
     return response.json()
 
-@app.post("/upload-site-map")
+@router.post("/upload-site-map")
 async def upload_file(file: UploadFile, token: Annotated[str, Depends(get_admin_user)]):
     file_read = await file.read()
     text_file = file_read.decode("utf-8")
@@ -236,7 +242,7 @@ async def upload_file(file: UploadFile, token: Annotated[str, Depends(get_admin_
         'response':'upload success',
     }
 
-@app.post('/upload-new-document')
+@router.post('/upload-new-document')
 async def upload_new_document(file: Annotated[UploadFile,File()] ,token: Annotated[str, Depends(get_admin_user)]):
     file_read = await file.read()
     text_file = file_read.decode("utf-8")
@@ -248,17 +254,17 @@ async def upload_new_document(file: Annotated[UploadFile,File()] ,token: Annotat
         return {"error": str(e)}
     return 'success'
 
-@app.get("/check-for-new-product")
+@router.get("/check-for-new-product")
 async def test_model(token: Annotated[str, Depends(get_admin_user)]):
     product_name = scrape_links()
     return {'message': product_name}
 
-@app.post('/find-links')
+@router.post('/find-links')
 def find_links(token: Annotated[str, Depends(get_admin_user)]):
     scrape_links()
     return {'message': 'link found'}
 
-@app.post("/token")
+@router.post("/token")
 async def authorise(form_data: Annotated[OAuth2PasswordRequestForm,Depends()]):
     user = form_data.username
     password = form_data.password
@@ -268,7 +274,7 @@ async def authorise(form_data: Annotated[OAuth2PasswordRequestForm,Depends()]):
     return {"access_token": token, 'token_type': 'bearer'}
 
 
-@app.post("/edit-system-message")
+@router.post("/edit-system-message")
 async def edit_system_message(
         token: Annotated[str, Depends(get_admin_user)],
         message: Annotated[str,Form()],
@@ -296,7 +302,7 @@ async def edit_system_message(
         raise HTTPException(status_code=500, detail=f"Error writing to file: {str(e)}")
 
 
-@app.get('/get-system-message')
+@router.get('/get-system-message')
 async def get_system_message(token: Annotated[str, Depends(get_admin_user)]):
     with open('prompts/system_message.txt', 'r', encoding='utf-8') as file:
         system_message = file.read()
@@ -308,9 +314,9 @@ async def get_system_message(token: Annotated[str, Depends(get_admin_user)]):
             }
 
 
-@app.get('/get-sessions')
+@router.get('/get-sessions')
 async def get_sessions(token: Annotated[str, Depends(get_admin_user)]):
-    sessions = Session(engine)
+    sessions = Session(get_engine())
     stmt = select(ChatSession)
     result = sessions.execute(stmt)
     chat_sessions = result.scalars().all()  # Get all session objects
@@ -325,9 +331,9 @@ async def get_sessions(token: Annotated[str, Depends(get_admin_user)]):
     sessions.close()  #
     return  sessions_data
 
-@app.get('/get-chat/{session_id}')
+@router.get('/get-chat/{session_id}')
 async def get_chat(session_id: str ,token: Annotated[str, Depends(get_admin_user)]):
-    sessions = Session(engine)
+    sessions = Session(get_engine())
     stmt = select(ChatMessage).where(ChatMessage.session_id == session_id).order_by(ChatMessage.created_at)
     session = sessions.execute(stmt)
     chat_messages = session.scalars().all()
@@ -341,3 +347,24 @@ async def get_chat(session_id: str ,token: Annotated[str, Depends(get_admin_user
             "created_at": chat_message.created_at.isoformat(),
         })
     return chats
+
+
+def create_app() -> FastAPI:
+    app = FastAPI(lifespan=lifespan)
+    origins = [
+        "http://localhost:3000",
+    ]
+    variable_origin = os.getenv("ORIGIN")
+    if variable_origin:
+        origins.append(str(variable_origin))
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.include_router(router)
+    return app
+
+
+app = create_app()
@@ -0,0 +1,63 @@
+"""Measure how long `import main` takes using `python -X importtime`.
+
+Usage:
+    python scripts/import_time.py [--top 15] [--max-ms 1500]
+
+Prints the total import time of `main` and the slowest top-level packages.
+With --max-ms the script exits with status 1 when the total exceeds the budget,
+so it can be used to catch startup regressions.
+"""
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def measure_imports(module: str = "main") -> list[tuple[str, int, int]]:
+    """Return (module, self_us, cumulative_us) for every import of `module`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    rows = measure_imports(args.module)
+    total_ms = next(cum for name, _, cum in rows if name == args.module) / 1000
+
+    packages = defaultdict(int)
+    for name, self_us, _ in rows:
+        packages[name.split(".")[0]] += self_us
+
+    print(f"import {args.module}: {total_ms:.1f} ms")
+    print(f"{'package':<30} {'self ms':>10}")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{package:<30} {self_us / 1000:>10.1f}")
+
+    if args.max_ms is not None and total_ms > args.max_ms:
+        print(f"import time {total_ms:.1f} ms exceeds budget of {args.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
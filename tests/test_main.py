@@ -0,0 +1,43 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = [
+    "langchain",
+    "langchain_core",
+    "langchain_community",
+    "langchain_openai",
+    "langchain_chroma",
+    "chromadb",
+    "bs4",
+    "telegram",
+    "apscheduler",
+]
+
+
+def test_import_main_defers_heavy_dependencies():
+    # Run in a fresh interpreter so modules imported by other tests don't leak in
+    code = (
+        "import sys, main; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+
+def test_create_app_does_not_build_clients():
+    import main
+    from db.engine import get_engine
+
+    main.get_bot.cache_clear()
+    get_engine.cache_clear()
+    app = main.create_app()
+
+    assert any(route.path == "/" for route in app.routes)
+    assert main.get_bot.cache_info().currsize == 0
+    assert get_engine.cache_info().currsize == 0
@@ -1,16 +1,12 @@
-from langchain_community.document_loaders import WebBaseLoader
-from langchain.chat_models import init_chat_model
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_openai import OpenAIEmbeddings
-from langchain_chroma import Chroma
-from bs4 import BeautifulSoup as bs
-import requests
-
-import chromadb
 import os
 
+# langchain, chromadb, bs4 and requests are imported inside the functions
+# below so that importing this module stays cheap at application startup.
+
 def scrape_links():
+    import requests
+    from bs4 import BeautifulSoup as bs
+
     response = requests.get(os.environ.get('CATALOG_PAGE_URL'))
     html_content = response.content
     soup = bs(html_content, 'html.parser')
@@ -25,6 +21,10 @@ def scrape_links():
 
 
 def scape_format_embed(link: str):
+    from langchain_community.document_loaders import WebBaseLoader
+    from langchain.chat_models import init_chat_model
+    from langchain_core.messages import HumanMessage, SystemMessage
+
     loader = WebBaseLoader(f'{link}')
     docs = loader.load()
     product_name = docs[0].metadata['title']
@@ -57,6 +57,10 @@ def scape_format_embed(link: str):
 
 
 def connect_chromadb():
+    import chromadb
+    from langchain_openai import OpenAIEmbeddings
+    from langchain_chroma import Chroma
+
     chroma_client = chromadb.CloudClient(
         api_key=f'{os.environ["CHROMA_CLOUD_API"]}',
         tenant=f'{os.environ["CHROMA_TENANT"]}',
@@ -78,6 +82,8 @@ def retrieve(query: str):
     return docs_content
 
 def process_text_to_chrome(text: str, metadata: dict):
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
     vector_store = connect_chromadb()
     text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
     all_splits = text_splitter.split_text(text=text)
@@ -85,6 +91,9 @@ def process_text_to_chrome(text: str, metadata: dict):
     vector_store.add_texts(texts=all_splits, metadatas=metadata_list)
 
 def define_message_intent(message: str, prompt: str):
+    from langchain.chat_models import init_chat_model
+    from langchain_core.messages import HumanMessage, SystemMessage
+
     model = init_chat_model("gpt-5-nano", model_provider='openai')
     model_message = [
         SystemMessage(content=prompt),